@@ -12,4 +12,21 @@ Example usage:
     if combined.is_satisfied_by(student):
         # Student meets both criteria
         pass
+
+    # Evaluating one ruleset over many students: compile once, call per student
+    is_eligible = combined.compile()
+    eligible = [student for student in students if is_eligible(student)]
 """
+from .specification import (
+    AndSpecification,
+    NotSpecification,
+    OrSpecification,
+    Specification,
+)
+
+__all__ = [
+    "AndSpecification",
+    "NotSpecification",
+    "OrSpecification",
+    "Specification",
+]
@@ -0,0 +1,138 @@
+"""
+Specification base class and boolean combinators.
+
+Specifications are frozen, slotted dataclasses, so equal rule trees compare and
+hash equal. compile() flattens a tree into a single predicate once and caches it
+by value, so evaluating the same ruleset over many candidates skips the
+recursive tree walk. Trees with unhashable fields (e.g. a list of subjects) are
+still compiled, just not cached.
+
+Subclasses must be declared with @dataclass(frozen=True, slots=True). A plain
+subclass that assigns attributes in __init__ fails with an obscure
+"super(type, obj)" TypeError from the frozen base class.
+"""
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+Predicate = Callable[[T], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class Specification(ABC, Generic[T]):
+    """A business rule that a candidate either satisfies or not."""
+
+    @abstractmethod
+    def is_satisfied_by(self, candidate: T) -> bool:
+        """Check whether the candidate satisfies this rule."""
+
+    def and_(self, other: "Specification[T]") -> "Specification[T]":
+        """Combine with another rule; both must be satisfied."""
+        return AndSpecification(self, other)
+
+    def or_(self, other: "Specification[T]") -> "Specification[T]":
+        """Combine with another rule; at least one must be satisfied."""
+        return OrSpecification(self, other)
+
+    def not_(self) -> "Specification[T]":
+        """Negate this rule."""
+        return NotSpecification(self)
+
+    def compile(self) -> Predicate[T]:
+        """Return a flat predicate equivalent to is_satisfied_by, cached per rule tree."""
+        try:
+            return _compile_cached(self)
+        except TypeError:
+            # Unhashable field somewhere in the tree; compile without the cache
+            return _compile_uncached(self)
+
+
+@dataclass(frozen=True, slots=True)
+class AndSpecification(Specification[T]):
+    """Satisfied when both operands are satisfied."""
+
+    left: Specification[T]
+    right: Specification[T]
+
+    def is_satisfied_by(self, candidate: T) -> bool:
+        return self.left.is_satisfied_by(candidate) and self.right.is_satisfied_by(candidate)
+
+
+@dataclass(frozen=True, slots=True)
+class OrSpecification(Specification[T]):
+    """Satisfied when at least one operand is satisfied."""
+
+    left: Specification[T]
+    right: Specification[T]
+
+    def is_satisfied_by(self, candidate: T) -> bool:
+        return self.left.is_satisfied_by(candidate) or self.right.is_satisfied_by(candidate)
+
+
+@dataclass(frozen=True, slots=True)
+class NotSpecification(Specification[T]):
+    """Satisfied when the operand is not satisfied."""
+
+    spec: Specification[T]
+
+    def is_satisfied_by(self, candidate: T) -> bool:
+        return not self.spec.is_satisfied_by(candidate)
+
+
+def _operands(
+    spec: Specification[Any],
+    kind: type[AndSpecification[Any]] | type[OrSpecification[Any]],
+) -> list[Specification[Any]]:
+    """Flatten nested combinators of the same kind, e.g. (a AND b) AND c -> [a, b, c]."""
+    if not isinstance(spec, kind):
+        return [spec]
+    return _operands(spec.left, kind) + _operands(spec.right, kind)
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(spec: Specification[Any]) -> Predicate[Any]:
+    """Compile a hashable rule tree, reusing the predicate for equal trees."""
+    return _compile(spec, _compile_cached)
+
+
+def _compile_uncached(spec: Specification[Any]) -> Predicate[Any]:
+    """Compile a rule tree that cannot be hashed, e.g. one with a list field."""
+    return _compile(spec, _compile_uncached)
+
+
+def _compile(
+    spec: Specification[Any],
+    compile_operand: Callable[[Specification[Any]], Predicate[Any]],
+) -> Predicate[Any]:
+    """Build a predicate that evaluates the rule tree without recursion."""
+    if isinstance(spec, AndSpecification):
+        all_of = tuple(compile_operand(operand) for operand in _operands(spec, AndSpecification))
+
+        def satisfies_all(candidate: Any) -> bool:
+            for predicate in all_of:
+                if not predicate(candidate):
+                    return False
+            return True
+
+        return satisfies_all
+
+    if isinstance(spec, OrSpecification):
+        any_of = tuple(compile_operand(operand) for operand in _operands(spec, OrSpecification))
+
+        def satisfies_any(candidate: Any) -> bool:
+            for predicate in any_of:
+                if predicate(candidate):
+                    return True
+            return False
+
+        return satisfies_any
+
+    if isinstance(spec, NotSpecification):
+        inner = compile_operand(spec.spec)
+        return lambda candidate: not inner(candidate)
+
+    return spec.is_satisfied_by
@@ -3,6 +3,8 @@ Application settings using Pydantic Settings.
 
 Loads configuration from environment variables with type safety and validation.
 """
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +17,11 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./regelverk.db"
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 30
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_RECYCLE: int = 3600
+    DATABASE_POOL_USE_LIFO: bool = True
 
     # API
     API_HOST: str = "0.0.0.0"
@@ -27,8 +34,16 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
+        # Build the validation schema on first Settings() call, not at class definition
+        defer_build=True,
     )
 
 
-# Singleton settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the application settings, loading them on first use.
+
+    Tests can call get_settings.cache_clear() to reload from the environment.
+    """
+    return Settings()
@@ -1,5 +1,22 @@
-"""Persistence module."""
+"""
+Persistence module.
+
+Base is imported eagerly for ORM model definitions; the database helpers are
+loaded on first access so model-only imports don't pull in engine setup.
+"""
+from typing import Any
+
 from .base import Base
-from .database import SessionLocal, engine, get_db_session
 
 __all__ = ["Base", "engine", "SessionLocal", "get_db_session"]
+
+_DATABASE_ATTRIBUTES = ("engine", "SessionLocal", "get_db_session")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve database helpers lazily (PEP 562)."""
+    if name in _DATABASE_ATTRIBUTES:
+        from . import database
+
+        return getattr(database, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,38 +2,115 @@
 Database engine and session management.
 
 Provides SQLAlchemy engine, session factory, and FastAPI dependency for database sessions.
+The engine and session factory are built on first use rather than at import time.
 """
-from typing import Generator
+from collections.abc import AsyncGenerator
+from functools import lru_cache
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.concurrency import run_in_threadpool
 
-from src.infrastructure.config import settings
+from src.infrastructure.config import Settings, get_settings
 
-# Create engine with SQLAlchemy 2.0 style
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-)
 
-# Session factory
-SessionLocal = sessionmaker(
-    bind=engine,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-)
+def _is_sqlite(settings: Settings) -> bool:
+    """Check whether the configured database is SQLite (any driver)."""
+    return settings.DATABASE_URL.startswith("sqlite")
 
 
-def get_db_session() -> Generator[Session, None, None]:
+def _is_sqlite_memory(settings: Settings) -> bool:
+    """Check whether the configured database is an in-memory SQLite database."""
+    url = make_url(settings.DATABASE_URL)
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Use WAL journaling so readers don't block on writes."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """
+    Build pool-related engine options for the configured database.
+
+    An in-memory SQLite database only exists on its own connection, so it gets a
+    single shared one. File SQLite keeps SQLAlchemy's default pool, so concurrent
+    sessions get separate connections and transactions.
+    """
+    if _is_sqlite(settings):
+        if _is_sqlite_memory(settings):
+            return {
+                "connect_args": {"check_same_thread": False},
+                "poolclass": StaticPool,
+            }
+        return {"connect_args": {"check_same_thread": False}}
+
+    return {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "pool_use_lifo": settings.DATABASE_POOL_USE_LIFO,
+    }
+
+
+@lru_cache(maxsize=1)
+def _engine() -> Engine:
+    """Create the SQLAlchemy 2.0 style engine from the current settings."""
+    settings = get_settings()
+    engine = create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        future=True,
+        **_engine_options(settings),
+    )
+    if _is_sqlite(settings):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def _session_factory() -> sessionmaker[Session]:
+    """Create the session factory bound to the engine."""
+    return sessionmaker(
+        bind=_engine(),
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Expose `engine` and `SessionLocal` as lazily built module attributes (PEP 562)."""
+    if name == "engine":
+        return _engine()
+    if name == "SessionLocal":
+        return _session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def get_db_session() -> AsyncGenerator[Session, None]:
     """
     FastAPI dependency for database sessions.
 
-    Yields a database session and ensures it's closed after use.
+    Yields a database session, rolls it back if the request fails, and ensures
+    it's closed after use so the connection returns to the pool promptly.
+    Rollback and close may hit the database, so they run in the threadpool
+    rather than blocking the event loop.
     """
-    session = SessionLocal()
+    session = _session_factory()()
     try:
         yield session
+    except Exception:
+        await run_in_threadpool(session.rollback)
+        raise
     finally:
-        session.close()
+        await run_in_threadpool(session.close)
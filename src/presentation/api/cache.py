@@ -0,0 +1,64 @@
+"""
+In-memory response cache for idempotent GET endpoints.
+
+Endpoints opt in with the cached_get decorator. Entries expire after a fixed
+TTL and the cache is bounded so memory use stays predictable.
+"""
+from collections.abc import Awaitable, Callable, Hashable
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from cachetools import TTLCache
+from starlette.responses import Response
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+CACHE_MAXSIZE = 1024
+CACHE_TTL_SECONDS = 60
+
+_cache: TTLCache[Hashable, Any] = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS)
+_MISSING = object()
+
+
+def cached_get(
+    key_func: Callable[P, Hashable],
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """
+    Cache the result of an async endpoint under the key built from its arguments.
+
+    Every cache hit returns the same object, so only plain data or immutable models
+    may be cached. Returning a Response raises TypeError: FastAPI attaches each
+    request's background tasks to the returned Response, so a shared instance would
+    rerun them and keep header changes across requests.
+
+    Example:
+        @router.get("/{student_id}")
+        @cached_get(lambda student_id: ("student", student_id))
+        async def get_student(student_id: str) -> StudentResponse:
+            ...
+    """
+
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = key_func(*args, **kwargs)
+            value = _cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value  # type: ignore[no-any-return]
+            value = await fn(*args, **kwargs)
+            if isinstance(value, Response):
+                raise TypeError(
+                    f"{fn.__qualname__} returned a Response; cached_get only caches plain data"
+                )
+            _cache[key] = value
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def clear_cache() -> None:
+    """Drop all cached responses, e.g. after writes or between tests."""
+    _cache.clear()
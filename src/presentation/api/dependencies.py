@@ -1,9 +1,10 @@
 """
 Dependency injection for FastAPI routes.
 
-Provides dependencies for database sessions and use cases.
+Provides dependencies for settings, database sessions and use cases.
 """
+from src.infrastructure.config import get_settings
 from src.infrastructure.persistence import get_db_session
 
 # Re-export for convenience
-__all__ = ["get_db_session"]
+__all__ = ["get_db_session", "get_settings"]
@@ -3,11 +3,17 @@ FastAPI application entry point.
 
 Main application setup with middleware, routes, and configuration.
 """
+import os
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.routing import Route
+
+from src.infrastructure.config import get_settings
+from src.presentation.api.middleware import FastCORS
+from src.presentation.api.routes.placeholder import routes as placeholder_routes
+from src.presentation.api.static import StaticEndpoint, mount_static_routes
 
-from src.infrastructure.config import settings
-from src.presentation.api.routes import admission_routes, quota_routes, student_routes
+settings = get_settings()
 
 # Create FastAPI application
 app = FastAPI(
@@ -15,29 +21,30 @@ app = FastAPI(
     description="API for Norwegian higher education admission rules system",
     version="0.1.0",
     debug=settings.DEBUG,
+    # Schema and docs are only served in debug mode, so production never builds them
+    openapi_url="/openapi.json" if settings.DEBUG else None,
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url=None,
 )
 
 # CORS middleware for frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173"],  # Vite dev server
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-# Health check endpoint
-@app.get("/health", tags=["health"])
-async def health_check() -> dict[str, str]:
-    """Health check endpoint."""
-    return {"status": "ok"}
+app.add_middleware(FastCORS, allow_origin=b"http://localhost:5173")  # Vite dev server
 
 
-# Include routers
-app.include_router(admission_routes.router)
-app.include_router(student_routes.router)
-app.include_router(quota_routes.router)
+# Constant-body endpoints are plain ASGI routes, matched before any FastAPI route.
+# Starlette matches routes in list order, so they are listed most requested first.
+# Include FastAPI routers above this point: a FastAPI route on one of these paths
+# would never be reached, so that is rejected at startup.
+static_routes = [
+    Route(
+        "/health",
+        StaticEndpoint(b"ok", media_type=b"text/plain; charset=utf-8"),
+        methods=["GET"],
+        name="health_check",
+    ),
+    *placeholder_routes,
+]
+mount_static_routes(app, static_routes)
 
 
 if __name__ == "__main__":
@@ -48,4 +55,10 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.DEBUG,
+        # One process per core in production; reload only supports a single worker
+        workers=1 if settings.DEBUG else (os.cpu_count() or 1),
+        # "auto" uses uvloop/httptools from uvicorn[standard] where the platform has them
+        loop="auto",
+        http="auto",
+        log_level=settings.LOG_LEVEL.lower(),
     )
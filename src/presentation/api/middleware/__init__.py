@@ -0,0 +1,4 @@
+"""API middleware module."""
+from .cors_asgi import FastCORS
+
+__all__ = ["FastCORS"]
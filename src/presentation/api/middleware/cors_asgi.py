@@ -0,0 +1,92 @@
+"""
+Pure ASGI CORS middleware.
+
+Answers preflight requests directly and stamps CORS headers onto outgoing
+responses without building Request/Response objects per call.
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class FastCORS:
+    """CORS middleware for a single allowed origin with credentials enabled."""
+
+    def __init__(self, app: ASGIApp, allow_origin: bytes) -> None:
+        self.app = app
+        self.allow_origin = allow_origin
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_headers = None
+        is_preflight = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                is_preflight = True
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and is_preflight:
+            await self._preflight(origin, request_headers, send)
+            return
+
+        if origin != self.allow_origin:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"access-control-allow-origin", self.allow_origin))
+                headers.append((b"access-control-allow-credentials", b"true"))
+                headers.append((b"vary", b"Origin"))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self, origin: bytes, request_headers: bytes | None, send: Send
+    ) -> None:
+        """Respond to a CORS preflight request without invoking the app."""
+        if origin != self.allow_origin:
+            body = b"Disallowed CORS origin"
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": [
+                        (b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [
+            (b"access-control-allow-origin", self.allow_origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-allow-methods", ALLOW_METHODS),
+            (b"access-control-max-age", b"600"),
+            (b"vary", b"Origin"),
+            (b"content-length", b"2"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+        # Browsers treat "*" literally when credentials are allowed, so echo
+        # the requested headers back instead.
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
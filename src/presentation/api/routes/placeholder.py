@@ -0,0 +1,29 @@
+"""
+Placeholder API routes.
+
+Serves the admission, students and quotas index endpoints from one table until
+they get real endpoints of their own. The bodies are constant, so they are plain
+Starlette routes with pre-encoded responses rather than FastAPI endpoints.
+"""
+import json
+
+from starlette.routing import Route
+
+from src.presentation.api.static import StaticEndpoint
+
+# (prefix slug, message) for each placeholder endpoint, most requested first
+SPECS = [
+    ("students", "Student API"),
+    ("admission", "Admission API"),
+    ("quotas", "Quota API"),
+]
+
+routes = [
+    Route(
+        f"/api/v1/{slug}/",
+        StaticEndpoint(json.dumps({"message": message}).encode()),
+        methods=["GET"],
+        name=f"get_{slug}_info",
+    )
+    for slug, message in SPECS
+]
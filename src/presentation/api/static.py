@@ -0,0 +1,56 @@
+"""
+Static ASGI endpoints.
+
+Provides a pure ASGI endpoint for routes whose body never changes, and mounts
+such routes ahead of the FastAPI routes.
+"""
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+
+class StaticEndpoint:
+    """
+    ASGI endpoint that always sends the same pre-encoded body.
+
+    Mounted as a plain Starlette route, it bypasses FastAPI's request handling,
+    dependency injection and response building entirely.
+    """
+
+    def __init__(self, body: bytes, media_type: bytes = b"application/json") -> None:
+        self.body = body
+        self.headers = [
+            (b"content-type", media_type),
+            (b"content-length", str(len(body)).encode()),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                # Copy so middleware appending headers never mutates the shared list
+                "headers": list(self.headers),
+            }
+        )
+        body = b"" if scope["method"] == "HEAD" else self.body
+        await send({"type": "http.response.body", "body": body})
+
+
+def mount_static_routes(app: FastAPI, routes: list[Route]) -> None:
+    """
+    Insert static routes at the front of the app's route list.
+
+    A FastAPI route already registered on one of these paths would be silently
+    shadowed, so that raises instead.
+    """
+    static_paths = {route.path for route in routes}
+    shadowed = sorted(
+        route.path
+        for route in app.router.routes
+        if isinstance(route, APIRoute) and route.path in static_paths
+    )
+    if shadowed:
+        raise RuntimeError(f"FastAPI routes shadowed by static routes: {', '.join(shadowed)}")
+    app.router.routes[:0] = routes
@@ -4,10 +4,27 @@ Shared pytest fixtures for all tests.
 This file provides common test fixtures and configuration used across
 unit, integration, and e2e tests.
 """
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
 import pytest
 
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
 
 @pytest.fixture
 def sample_fixture() -> str:
     """Example fixture - will be replaced with real fixtures as needed."""
     return "test"
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator["TestClient"]:
+    """API test client, started once per test session so lifespan runs only once."""
+    from fastapi.testclient import TestClient
+
+    from src.presentation.api.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
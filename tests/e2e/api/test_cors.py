@@ -0,0 +1,55 @@
+"""
+E2E tests for the CORS middleware.
+
+Tests preflight handling and header stamping on regular responses.
+"""
+from fastapi.testclient import TestClient
+
+ALLOWED_ORIGIN = "http://localhost:5173"
+
+
+def test_preflight_echoes_requested_headers(client: TestClient) -> None:
+    """Test that preflight from the allowed origin is answered with CORS headers."""
+    response = client.options(
+        "/api/v1/students/",
+        headers={
+            "Origin": ALLOWED_ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-headers"] == "content-type"
+
+
+def test_preflight_from_unknown_origin_is_rejected(client: TestClient) -> None:
+    """Test that preflight from an unknown origin is rejected."""
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": "http://evil.example",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_simple_request_from_allowed_origin_gets_cors_headers(client: TestClient) -> None:
+    """Test that regular responses to the allowed origin carry CORS headers."""
+    response = client.get("/health", headers={"Origin": ALLOWED_ORIGIN})
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+
+
+def test_simple_request_from_unknown_origin_has_no_cors_headers(client: TestClient) -> None:
+    """Test that regular responses to unknown origins carry no CORS headers."""
+    response = client.get("/health", headers={"Origin": "http://evil.example"})
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
@@ -5,20 +5,25 @@ Tests the FastAPI application startup and basic endpoint functionality.
 """
 from fastapi.testclient import TestClient
 
-from src.presentation.api.main import app
+from src.presentation.api.main import app, static_routes
 
-client = TestClient(app)
 
-
-def test_health_endpoint_returns_ok() -> None:
+def test_health_endpoint_returns_ok(client: TestClient) -> None:
     """Test that health endpoint returns 200 OK."""
     response = client.get("/health")
 
     assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
+    assert response.text == "ok"
+
+
+def test_health_endpoint_only_allows_get(client: TestClient) -> None:
+    """Test that the static health route rejects other methods."""
+    response = client.post("/health")
+
+    assert response.status_code == 405
 
 
-def test_admission_placeholder_endpoint() -> None:
+def test_admission_placeholder_endpoint(client: TestClient) -> None:
     """Test admission placeholder endpoint."""
     response = client.get("/api/v1/admission/")
 
@@ -26,7 +31,7 @@ def test_admission_placeholder_endpoint() -> None:
     assert response.json() == {"message": "Admission API"}
 
 
-def test_students_placeholder_endpoint() -> None:
+def test_students_placeholder_endpoint(client: TestClient) -> None:
     """Test students placeholder endpoint."""
     response = client.get("/api/v1/students/")
 
@@ -34,7 +39,7 @@ def test_students_placeholder_endpoint() -> None:
     assert response.json() == {"message": "Student API"}
 
 
-def test_quotas_placeholder_endpoint() -> None:
+def test_quotas_placeholder_endpoint(client: TestClient) -> None:
     """Test quotas placeholder endpoint."""
     response = client.get("/api/v1/quotas/")
 
@@ -42,7 +47,7 @@ def test_quotas_placeholder_endpoint() -> None:
     assert response.json() == {"message": "Quota API"}
 
 
-def test_cors_headers_present() -> None:
+def test_cors_headers_present(client: TestClient) -> None:
     """Test that CORS headers are configured."""
     response = client.options(
         "/health",
@@ -54,3 +59,12 @@ def test_cors_headers_present() -> None:
 
     assert response.status_code == 200
     assert "access-control-allow-origin" in response.headers
+
+
+def test_static_routes_are_matched_first() -> None:
+    """Test that the constant endpoints lead the route list in their listed order."""
+    leading_routes = app.router.routes[: len(static_routes)]
+    leading_paths = [getattr(route, "path", "") for route in leading_routes]
+
+    assert leading_paths == [route.path for route in static_routes]
+    assert leading_paths[:2] == ["/health", "/api/v1/students/"]
@@ -0,0 +1,105 @@
+"""
+Unit tests for the Specification base class and combinators.
+"""
+from dataclasses import dataclass
+
+import pytest
+
+from src.domain.specifications import AndSpecification, Specification
+
+
+@dataclass(frozen=True, slots=True)
+class AtLeast(Specification[int]):
+    """Test specification: number is at least the threshold."""
+
+    threshold: int
+
+    def is_satisfied_by(self, candidate: int) -> bool:
+        return candidate >= self.threshold
+
+
+@dataclass(frozen=True, slots=True)
+class Even(Specification[int]):
+    """Test specification: number is even."""
+
+    def is_satisfied_by(self, candidate: int) -> bool:
+        return candidate % 2 == 0
+
+
+def test_and_requires_both() -> None:
+    """Test that and_ is satisfied only when both rules are."""
+    spec = AtLeast(4).and_(Even())
+
+    assert spec.is_satisfied_by(6)
+    assert not spec.is_satisfied_by(5)
+    assert not spec.is_satisfied_by(2)
+
+
+def test_or_and_not_combinators() -> None:
+    """Test that or_ and not_ combine rules as expected."""
+    spec = AtLeast(4).or_(Even()).not_()
+
+    assert spec.is_satisfied_by(3)
+    assert not spec.is_satisfied_by(2)
+    assert not spec.is_satisfied_by(5)
+
+
+def test_equal_rule_trees_are_equal_and_hashable() -> None:
+    """Test that rebuilding the same tree gives an equal, hashable specification."""
+    first = AtLeast(4).and_(Even())
+    second = AtLeast(4).and_(Even())
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert isinstance(first, AndSpecification)
+
+
+def test_compile_is_cached_for_equal_rule_trees() -> None:
+    """Test that compiling an equal tree reuses the same predicate."""
+    first = AtLeast(4).and_(Even()).and_(AtLeast(2))
+    second = AtLeast(4).and_(Even()).and_(AtLeast(2))
+
+    assert first.compile() is second.compile()
+
+
+@pytest.mark.parametrize("candidate", range(-3, 10))
+def test_compiled_predicate_matches_is_satisfied_by(candidate: int) -> None:
+    """Test that the compiled predicate agrees with direct evaluation."""
+    spec = AtLeast(4).and_(Even()).or_(AtLeast(8).not_().and_(AtLeast(0)))
+
+    assert spec.compile()(candidate) is spec.is_satisfied_by(candidate)
+
+
+@dataclass(frozen=True, slots=True)
+class OneOf(Specification[int]):
+    """Test specification with an unhashable field."""
+
+    allowed: list[int]
+
+    def is_satisfied_by(self, candidate: int) -> bool:
+        return candidate in self.allowed
+
+
+def test_compile_works_for_unhashable_specifications() -> None:
+    """Test that specs with list fields compile without the cache."""
+    spec = OneOf([2, 3]).and_(Even())
+
+    is_satisfied = spec.compile()
+
+    assert is_satisfied(2)
+    assert not is_satisfied(3)
+    assert not is_satisfied(4)
+
+
+def test_non_dataclass_subclass_cannot_set_attributes() -> None:
+    """Test that subclasses must be frozen dataclasses to hold state."""
+
+    class PlainAtLeast(Specification[int]):
+        def __init__(self, threshold: int) -> None:
+            self.threshold = threshold
+
+        def is_satisfied_by(self, candidate: int) -> bool:
+            return candidate >= self.threshold
+
+    with pytest.raises(TypeError):
+        PlainAtLeast(4)
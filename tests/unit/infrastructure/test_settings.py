@@ -0,0 +1,21 @@
+"""
+Unit tests for application settings loading.
+"""
+import pytest
+
+from src.infrastructure.config import get_settings
+
+
+def test_get_settings_returns_cached_instance() -> None:
+    """Test that settings are loaded once and reused."""
+    assert get_settings() is get_settings()
+
+
+def test_cache_clear_reloads_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that clearing the cache picks up changed environment variables."""
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    get_settings.cache_clear()
+    try:
+        assert get_settings().LOG_LEVEL == "DEBUG"
+    finally:
+        get_settings.cache_clear()
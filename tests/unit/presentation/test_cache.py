@@ -0,0 +1,68 @@
+"""
+Unit tests for the in-memory GET response cache.
+"""
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from starlette.responses import Response
+
+from src.presentation.api.cache import cached_get, clear_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    """Start and end each test with an empty cache."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_repeated_calls_with_same_key_hit_the_cache() -> None:
+    """Test that the endpoint body runs once per key."""
+    calls: list[str] = []
+
+    @cached_get(lambda student_id: ("student", student_id))
+    async def get_student(student_id: str) -> dict[str, str]:
+        calls.append(student_id)
+        return {"id": student_id}
+
+    async def run() -> None:
+        assert await get_student("a") == {"id": "a"}
+        assert await get_student("a") == {"id": "a"}
+        assert await get_student("b") == {"id": "b"}
+
+    asyncio.run(run())
+
+    assert calls == ["a", "b"]
+
+
+def test_none_results_are_cached() -> None:
+    """Test that a None result is cached rather than treated as a miss."""
+    calls: list[str] = []
+
+    @cached_get(lambda student_id: ("missing", student_id))
+    async def find_student(student_id: str) -> None:
+        calls.append(student_id)
+
+    async def run() -> None:
+        await find_student("a")
+        await find_student("a")
+
+    asyncio.run(run())
+
+    assert calls == ["a"]
+
+
+def test_response_results_are_rejected() -> None:
+    """Test that Response objects, which are mutated per request, are never cached."""
+
+    @cached_get(lambda student_id: ("response", student_id))
+    async def get_student(student_id: str) -> Response:
+        return Response(content=student_id)
+
+    async def run() -> None:
+        await get_student("a")
+
+    with pytest.raises(TypeError, match="Response"):
+        asyncio.run(run())
@@ -0,0 +1,34 @@
+"""
+Unit tests for static ASGI endpoints and their mounting.
+"""
+import pytest
+from fastapi import FastAPI
+from starlette.routing import Route
+
+from src.presentation.api.static import StaticEndpoint, mount_static_routes
+
+
+def test_static_routes_are_matched_first() -> None:
+    """Test that static routes are inserted ahead of existing routes."""
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+
+    @app.get("/other")
+    async def other() -> dict[str, str]:
+        return {}
+
+    static = Route("/static", StaticEndpoint(b"{}"), methods=["GET"])
+    mount_static_routes(app, [static])
+
+    assert app.router.routes[0] is static
+
+
+def test_fastapi_route_on_static_path_is_rejected() -> None:
+    """Test that a FastAPI route that would be shadowed raises at startup."""
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {}
+
+    with pytest.raises(RuntimeError, match="/health"):
+        mount_static_routes(app, [Route("/health", StaticEndpoint(b"ok"), methods=["GET"])])